@@ -4,17 +4,31 @@ JIRA Worklog Riport Készítő
 Lekérdezi egy adott felhasználó worklogjait JIRA-ból és riportot készít
 """
 
+import time
+
+# Indulási időmérés kezdőpontja (a benchmarkhoz, minden más import előtt)
+_START_TIME = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import importlib
 import json
 import os
+import sys
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional
 from collections import defaultdict
-from jira import JIRA
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
+
+# A jira és openpyxl modulok lassan töltődnek be, ezért nem a modul tetején
+# importáljuk őket: az ablak azonnal megjelenik, a betöltés háttérszálon fut.
+HEAVY_MODULES = ('jira', 'openpyxl', 'openpyxl.styles', 'openpyxl.utils')
+
+
+def preload_heavy_modules():
+    """Nehéz modulok betöltése (háttérszálból hívva)"""
+    for module_name in HEAVY_MODULES:
+        importlib.import_module(module_name)
 
 
 class JiraWorklogApp:
@@ -27,11 +41,21 @@ class JiraWorklogApp:
         self.jira_config = None
         self.jira_client = None
         
+        # Háttérben előkészített JIRA kapcsolat
+        self.warmup_thread = None
+        self.warmup_done_time = None
+        self.prewarmed_client = None
+        self.prewarmed_user = None
+        self.prewarm_error = None
+        
         # GUI felépítése
         self.setup_ui()
         
         # Auth.json betöltése
         self.load_auth_config()
+        
+        # Modulok betöltése és JIRA kapcsolat előkészítése háttérben
+        self.start_background_warmup()
     
     def setup_ui(self):
         """GUI felület létrehozása"""
@@ -145,11 +169,76 @@ class JiraWorklogApp:
         self.status_text.configure(state='disabled')
         self.root.update()
     
+    def start_background_warmup(self):
+        """Háttérszál indítása a modulok betöltésére és a JIRA kapcsolat előkészítésére"""
+        self.warmup_thread = threading.Thread(
+            target=self.background_warmup,
+            args=(self.jira_config,),
+            daemon=True
+        )
+        self.warmup_thread.start()
+        self.root.after(100, self.check_warmup)
+    
+    def background_warmup(self, jira_config: Optional[Dict]):
+        """Háttérszál: modulok betöltése és JIRA kliens létrehozása (tkinter hívás nélkül)"""
+        try:
+            preload_heavy_modules()
+            
+            if jira_config:
+                from jira import JIRA
+                
+                client = JIRA(
+                    server=jira_config['url'],
+                    token_auth=jira_config['pat']
+                )
+                self.prewarmed_user = client.myself()
+                self.prewarmed_client = client
+        except Exception as e:
+            self.prewarm_error = e
+        finally:
+            self.warmup_done_time = time.perf_counter()
+    
+    def check_warmup(self):
+        """Háttérszál állapotának figyelése a fő szálon"""
+        if self.warmup_thread.is_alive():
+            self.root.after(100, self.check_warmup)
+            return
+        
+        if self.prewarmed_client is not None:
+            self.log_status("JIRA kapcsolat előkészítve a háttérben")
+        elif self.prewarm_error is not None:
+            self.log_status(f"Háttér csatlakozás sikertelen, lekérdezéskor újrapróbálva: {str(self.prewarm_error)}")
+    
+    def wait_for_warmup(self):
+        """Várakozás a háttérszálra, közben a GUI frissítése"""
+        if self.warmup_thread is None:
+            return
+        
+        while self.warmup_thread.is_alive():
+            self.root.update()
+            self.warmup_thread.join(0.05)
+    
     def connect_jira(self) -> bool:
         """Csatlakozás JIRA-hoz"""
+        self.wait_for_warmup()
+        
+        # Előkészített kapcsolat használata (csak egyszer, utána újracsatlakozás)
+        if self.prewarmed_client is not None:
+            self.jira_client = self.prewarmed_client
+            user = self.prewarmed_user
+            self.prewarmed_client = None
+            self.prewarmed_user = None
+            self.log_status(f"Sikeres csatlakozás! Bejelentkezve mint: {user['displayName']}")
+            return True
+        
+        # Sikertelen háttér csatlakozás: újrapróbálás, a hibát itt jelezzük
+        self.prewarm_error = None
+        
         try:
             self.log_status("Csatlakozás JIRA-hoz...")
             
+            from jira import JIRA
+            
             self.jira_client = JIRA(
                 server=self.jira_config['url'],
                 token_auth=self.jira_config['pat']
@@ -291,6 +380,10 @@ class JiraWorklogApp:
             
             self.log_status(f"Excel riport készítése: {filename}")
             
+            import openpyxl
+            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+            from openpyxl.utils import get_column_letter
+            
             # Workbook létrehozása
             wb = openpyxl.Workbook()
             wb.remove(wb.active)  # Alapértelmezett lap törlése
@@ -648,7 +741,36 @@ class JiraWorklogApp:
             self.progress.stop()
 
 
+def benchmark_startup(headless: bool = False):
+    """Indulási idő mérése (GUI, vagy --headless esetén ablak nélkül)"""
+    import_time = time.perf_counter() - _START_TIME
+    print(f"Modul import: {import_time:.3f} s")
+    
+    if headless:
+        # Ablak nélkül csak a háttérben betöltött modulok idejét mérjük
+        preload_start = time.perf_counter()
+        preload_heavy_modules()
+        print(f"Nehéz modulok betöltése: {time.perf_counter() - preload_start:.3f} s")
+        return
+    
+    root = tk.Tk()
+    app = JiraWorklogApp(root)
+    root.update()
+    print(f"Ablak megjelenése: {time.perf_counter() - _START_TIME:.3f} s")
+    
+    app.warmup_thread.join()
+    print(f"Háttér előkészítés kész: {app.warmup_done_time - _START_TIME:.3f} s")
+    if app.prewarm_error is not None:
+        print(f"Háttér csatlakozás sikertelen: {str(app.prewarm_error)}")
+    
+    root.destroy()
+
+
 def main():
+    if '--startup-benchmark' in sys.argv:
+        benchmark_startup(headless='--headless' in sys.argv)
+        return
+    
     root = tk.Tk()
     app = JiraWorklogApp(root)
     root.mainloop()